@@ -2,29 +2,47 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, colorchooser, simpledialog
 import json
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Optional
-import webbrowser
-from PIL import Image, ImageTk
-import os
+from pathlib import Path
+
+# orjson is optional; it's much faster than the stdlib for large layouts
+try:
+    import orjson
+
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data):
+        return json.dumps(data, indent=2).encode()
+
+    _loads = json.loads
 
 # Constants
 APP_NAME = "LUL Layout Manager"
 VERSION = "0.0.1"
-DEFAULT_THEME = {
-    'bg': '#2d2d2d',
-    'fg': '#ffffff',
-    'toolbar_bg': '#1e1e1e',
-    'canvas_bg': '#252526',
-    'highlight': '#007acc',
-    'widget_outline': '#3e3e42'
-}
-SUPPORTED_WIDGETS = [
+LOGO_PATH = Path(__file__).parent / "logo.png"
+HAS_LOGO = LOGO_PATH.is_file()  # Checked once at startup
+# Default theme colours
+THEME_BG = '#2d2d2d'
+THEME_FG = '#ffffff'
+THEME_TOOLBAR_BG = '#1e1e1e'
+THEME_CANVAS_BG = '#252526'
+THEME_HIGHLIGHT = '#007acc'
+THEME_OUTLINE = '#3e3e42'
+SUPPORTED_WIDGETS = (
     'Button', 'Label', 'Entry', 'Text', 'Checkbutton',
     'Radiobutton', 'Scale', 'Listbox', 'Scrollbar',
     'Frame', 'LabelFrame', 'Combobox', 'Progressbar'
-]
+)
 GRID_SIZE = 20  # Snap-to-grid size
+WIDGET_BINDTAG = "DraggableWidget"  # Shared bindtag for drag/hover events
+UNDO_LIMIT = 200  # Max entries kept on each of the undo/redo stacks
+MOVE_MERGE_WINDOW = 0.5  # Seconds within which moves of one widget share an undo step
 
 # Configure logging
 logging.basicConfig(
@@ -33,7 +51,111 @@ logging.basicConfig(
     filename='layout_manager.log'
 )
 
-@dataclass
+def config_value(options, name):
+    """Current value of ``name`` in a ``widget.configure()`` dict, or ''.
+
+    Alias entries such as ``bg`` are 2-tuples pointing at the real option
+    and are treated as missing.
+    """
+    entry = options.get(name)
+    return entry[-1] if entry and len(entry) == 5 else ''
+
+def _fill_listbox(widget):
+    for item in ["Item 1", "Item 2", "Item 3"]:
+        widget.insert(tk.END, item)
+
+def _half_fill_progressbar(widget):
+    widget.step(50)
+
+# Widget type -> (class, default constructor options, optional setup hook).
+# Used both to build placed widgets and to export them as Python code.
+WIDGET_FACTORIES: Dict[str, tuple] = {
+    'Button': (ttk.Button, {'text': "Button"}, None),
+    'Label': (ttk.Label, {'text': "Label"}, None),
+    'Entry': (ttk.Entry, {}, None),
+    'Text': (tk.Text, {'width': 30, 'height': 5}, None),
+    'Checkbutton': (ttk.Checkbutton, {'text': "Checkbutton"}, None),
+    'Radiobutton': (ttk.Radiobutton, {'text': "Radiobutton"}, None),
+    'Scale': (ttk.Scale, {'from_': 0, 'to': 100}, None),
+    'Listbox': (tk.Listbox, {'height': 4}, _fill_listbox),
+    'Scrollbar': (ttk.Scrollbar, {}, None),
+    'Frame': (ttk.Frame, {'width': 200, 'height': 200, 'relief': tk.RIDGE}, None),
+    'LabelFrame': (ttk.LabelFrame, {'text': "LabelFrame", 'width': 200, 'height': 200}, None),
+    'Combobox': (ttk.Combobox, {'values': ["Option 1", "Option 2", "Option 3"]}, None),
+    'Progressbar': (ttk.Progressbar, {'length': 200, 'mode': 'determinate'}, _half_fill_progressbar),
+}
+
+def create_widget(widget_type, parent):
+    cls, defaults, setup = WIDGET_FACTORIES[widget_type]
+    widget = cls(parent, **defaults)
+    if setup:
+        setup(widget)
+    return widget
+
+def _literal(value):
+    # Tk hands back Tcl_Obj for some options (relief, pixel sizes); export
+    # those as their string form so repr() yields a usable literal
+    if isinstance(value, tuple):
+        return tuple(_literal(v) for v in value)
+    if isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+# Widget type -> ("module.Class", ((keyword, Tk option name), ...)), derived
+# once from WIDGET_FACTORIES so exporting does no per-widget string work
+_EXPORT_SPECS: Dict[str, tuple] = {
+    widget_type: (
+        f"{'ttk' if cls.__module__ == 'tkinter.ttk' else 'tk'}.{cls.__name__}",
+        tuple((key, key.rstrip('_')) for key in defaults),
+    )
+    for widget_type, (cls, defaults, _) in WIDGET_FACTORIES.items()
+}
+
+def _constructor_code(widget_type, widget, var_name):
+    """Exported constructor line for ``widget``, passing the current values
+    of the options its type is created with."""
+    constructor, option_names = _EXPORT_SPECS[widget_type]
+    kwargs = []
+    for key, name in option_names:
+        try:
+            value = widget.cget(name)
+        except tk.TclError:
+            continue  # Not an option of this widget; leave it at its default
+        kwargs.append(f", {key}={_literal(value)!r}")
+    return f"    {var_name} = {constructor}(root{''.join(kwargs)})\n"
+
+def _export_widget(index, dw):
+    """Exported block for one placed widget: constructor, place() and a blank line."""
+    var_name = f"widget_{index}"
+    return (
+        _constructor_code(dw.widget_type, dw.widget, var_name)
+        + f"    {var_name}.place(x={dw.x}, y={dw.y})\n\n"
+    )
+
+# Static parts of the exported script; only the widget blocks vary
+_GUI_TEMPLATE = (
+    "import tkinter as tk\n"
+    "from tkinter import ttk\n"
+    "\n"
+    "def create_gui():\n"
+    "    root = tk.Tk()\n"
+    "    root.title('Generated GUI')\n"
+    "\n"
+    "{body}"
+    "    root.mainloop()\n"
+    "\n"
+    "if __name__ == '__main__':\n"
+    "    create_gui()"
+)
+
+class UndoOp:
+    """Undo entry kinds; plain ints so dispatch is a cheap int compare/lookup."""
+    CREATE = 0
+    DELETE = 1
+    MOVE = 2
+    GROUP = 3
+
+@dataclass(slots=True)
 class WidgetData:
     type: str
     x: int
@@ -42,6 +164,12 @@ class WidgetData:
     id: Optional[int] = None
 
 class DraggableWidget:
+    __slots__ = (
+        'builder', 'canvas', 'widget', 'widget_type', 'x', 'y', 'properties',
+        'selected', 'original_x', 'original_y', 'id', 'start_x', 'start_y',
+        '_current_width', '_pending_motion'
+    )
+    
     def __init__(self, builder, canvas, widget, widget_type, x, y, properties=None):
         self.builder = builder  # Reference to the GUIBuilder for undo callbacks
         self.canvas = canvas
@@ -51,6 +179,8 @@ class DraggableWidget:
         self.y = y
         self.properties = properties or {}
         self.selected = False
+        self._current_width = None  # Last width pushed to the canvas item
+        self._pending_motion = None  # Snapped (x, y) awaiting _apply_motion
         
         # Record original position for undo support
         self.original_x = x
@@ -66,37 +196,20 @@ class DraggableWidget:
         )
         
         self._add_dragging_support()
-        self._add_context_menu()
         self.update_appearance()
     
     def _add_dragging_support(self):
-        self.widget.bind("<ButtonPress-1>", self.on_start)
-        self.widget.bind("<B1-Motion>", self.on_drag)
-        self.widget.bind("<ButtonRelease-1>", self.on_release)
-        self.widget.bind("<Enter>", self.on_hover)
-        self.widget.bind("<Leave>", self.on_leave)
-    
-    def _add_context_menu(self):
-        self.menu = tk.Menu(self.canvas, tearoff=0)
-        self.menu.add_command(label="Properties", command=self.edit_properties)
-        self.menu.add_command(label="Delete", command=self.delete)
-        self.menu.add_separator()
-        self.menu.add_command(label="Bring to Front", command=self.bring_to_front)
-        self.menu.add_command(label="Send to Back", command=self.send_to_back)
-        
-        if self.widget_type in ['Frame', 'LabelFrame']:
-            self.menu.add_separator()
-            self.menu.add_command(label="Add Widget Inside", command=self.add_widget_inside)
-        
-        self.widget.bind("<Button-3>", self.show_context_menu)
+        # The handlers are bound once on the shared bindtag by
+        # GUIBuilder.setup_widget_bindings; the widget only needs to carry it.
+        self.widget.bindtags((WIDGET_BINDTAG,) + self.widget.bindtags())
     
     def update_appearance(self):
         # Note: canvas windows don’t inherently have an outline.
         # In a more robust solution, you might wrap the widget in a Frame with a border.
-        if self.selected:
-            self.canvas.itemconfig(self.id, width=2)
-        else:
-            self.canvas.itemconfig(self.id, width=1)
+        desired = 2 if self.selected else 1
+        if desired != self._current_width:
+            self.canvas.itemconfig(self.id, width=desired)
+            self._current_width = desired
     
     def on_start(self, event):
         self.start_x = event.x
@@ -116,6 +229,18 @@ class DraggableWidget:
         new_x = round(new_x / GRID_SIZE) * GRID_SIZE
         new_y = round(new_y / GRID_SIZE) * GRID_SIZE
         
+        # Motion events can arrive faster than we redraw; keep only the latest
+        # target and apply it once when the event queue drains.
+        if self._pending_motion is None:
+            self.canvas.after_idle(self._apply_motion)
+        self._pending_motion = (new_x, new_y)
+    
+    def _apply_motion(self):
+        if self._pending_motion is None:
+            return
+        new_x, new_y = self._pending_motion
+        self._pending_motion = None
+        
         dx = new_x - self.x
         dy = new_y - self.y
         
@@ -125,10 +250,16 @@ class DraggableWidget:
             self.y = new_y
     
     def on_release(self, event):
+        # Flush any motion still waiting for the idle callback
+        self._apply_motion()
         self.update_appearance()
         # Push undo action if widget has moved
         if (self.x, self.y) != (self.original_x, self.original_y):
-            self.builder.push_undo(('move', self, self.original_x, self.original_y))
+            self.builder.push_undo((
+                UndoOp.MOVE, self.id,
+                self.x - self.original_x, self.y - self.original_y,
+                time.monotonic()
+            ))
     
     def on_hover(self, event):
         self.widget.config(cursor="hand2")
@@ -137,22 +268,31 @@ class DraggableWidget:
         self.widget.config(cursor="")
     
     def show_context_menu(self, event):
+        # The menu is shared by all widgets; point it at this one
+        menu = self.builder.get_context_menu(self.widget_type in ['Frame', 'LabelFrame'])
+        self.builder.context_menu_target = self
         try:
             self.select()
-            self.menu.tk_popup(event.x_root, event.y_root)
+            menu.tk_popup(event.x_root, event.y_root)
         finally:
-            self.menu.grab_release()
+            menu.grab_release()
     
     def select(self):
-        # Deselect all other widgets first
-        for item in self.canvas.find_withtag("widget"):
-            self.canvas.itemconfig(item, width=1)
+        # Only the currently selected widgets need deselecting
+        selection = self.builder.selected
+        if self.selected and len(selection) == 1:
+            return
+        for other in list(selection):
+            if other is not self:
+                other.deselect()
+        selection.add(self)
         self.selected = True
         self.update_appearance()
         self.canvas.tag_raise(self.id)
     
     def deselect(self):
         self.selected = False
+        self.builder.selected.discard(self)
         self.update_appearance()
     
     def edit_properties(self):
@@ -161,6 +301,7 @@ class DraggableWidget:
     def delete(self):
         self.canvas.delete(self.id)
         self.widget.destroy()
+        self.builder.unregister_widget(self)
     
     def bring_to_front(self):
         self.canvas.tag_raise(self.id)
@@ -231,13 +372,16 @@ class PropertyEditor(tk.Toplevel):
         self.tree.bind('<<TreeviewSelect>>', self.on_property_select)
     
     def load_properties(self):
+        # Fetch every option in one Tcl call rather than a cget per property
+        opts = self.widget.configure() if hasattr(self.widget, 'configure') else {}
+        
         # Common properties
         properties = {
-            'text': getattr(self.widget, 'cget')('text') if hasattr(self.widget, 'cget') else '',
-            'background': getattr(self.widget, 'cget')('bg') if hasattr(self.widget, 'cget') else '',
-            'foreground': getattr(self.widget, 'cget')('fg') if hasattr(self.widget, 'cget') else '',
-            'width': getattr(self.widget, 'cget')('width') if hasattr(self.widget, 'cget') else '',
-            'height': getattr(self.widget, 'cget')('height') if hasattr(self.widget, 'cget') else '',
+            'text': config_value(opts, 'text'),
+            'background': config_value(opts, 'background'),
+            'foreground': config_value(opts, 'foreground'),
+            'width': config_value(opts, 'width'),
+            'height': config_value(opts, 'height'),
             'x': self.draggable_widget.x,
             'y': self.draggable_widget.y
         }
@@ -246,9 +390,9 @@ class PropertyEditor(tk.Toplevel):
         if self.widget_type == 'Button':
             properties['command'] = ''
         elif self.widget_type == 'Entry':
-            properties['show'] = getattr(self.widget, 'cget')('show') if hasattr(self.widget, 'cget') else ''
+            properties['show'] = config_value(opts, 'show')
         elif self.widget_type == 'Text':
-            properties['wrap'] = getattr(self.widget, 'cget')('wrap') if hasattr(self.widget, 'cget') else ''
+            properties['wrap'] = config_value(opts, 'wrap')
         
         for prop, value in properties.items():
             self.tree.insert('', 'end', text=prop, values=(value,))
@@ -329,10 +473,35 @@ class GUIBuilder:
         
         # Application state
         self.active_widget = None
-        self.widgets = []
+        self.widgets = {}  # Canvas item id -> DraggableWidget, in placement order
+        self.widgets_by_path = {}  # Tk widget path -> DraggableWidget
+        self.selected = set()  # DraggableWidgets with selected=True
+        self.context_menus = {}  # Built on first use, keyed by "is a container"
+        self.context_menu_target = None
         self.current_file = None
-        self.undo_stack = []
-        self.redo_stack = []
+        # Entries are (UndoOp.CREATE | UndoOp.DELETE, WidgetData snapshot),
+        # (UndoOp.MOVE, item_id, dx, dy, timestamp) or
+        # (UndoOp.GROUP, [entries...]).
+        # Bounded, so the oldest entries are dropped in long sessions.
+        self.undo_stack = deque(maxlen=UNDO_LIMIT)
+        self.redo_stack = deque(maxlen=UNDO_LIMIT)
+        # Canvas item ids of widgets rebuilt by undo/redo -> their new ids
+        self.id_aliases = {}
+        self._about_photo = None  # Resized About logo, built on first use
+        
+        # UndoOp -> handler, called with the rest of the entry's fields
+        self._revert_handlers = {
+            UndoOp.CREATE: self.discard_snapshot,
+            UndoOp.DELETE: self.restore_snapshot,
+            UndoOp.MOVE: lambda widget_id, dx, dy, _: self.shift_widget(widget_id, -dx, -dy),
+            UndoOp.GROUP: self._revert_group,
+        }
+        self._apply_handlers = {
+            UndoOp.CREATE: self.restore_snapshot,
+            UndoOp.DELETE: self.discard_snapshot,
+            UndoOp.MOVE: lambda widget_id, dx, dy, _: self.shift_widget(widget_id, dx, dy),
+            UndoOp.GROUP: self._apply_group,
+        }
         
         # Configure styles
         self.setup_styles()
@@ -343,6 +512,9 @@ class GUIBuilder:
         # Bind keyboard shortcuts
         self.setup_shortcuts()
         
+        # Bind drag/hover handlers shared by all placed widgets
+        self.setup_widget_bindings()
+        
         # Create grid
         self.show_grid()
         
@@ -354,16 +526,16 @@ class GUIBuilder:
         style.theme_use('clam')
         
         # Configure colors
-        style.configure('.', background=DEFAULT_THEME['bg'], foreground=DEFAULT_THEME['fg'])
-        style.configure('TFrame', background=DEFAULT_THEME['bg'])
-        style.configure('TButton', background=DEFAULT_THEME['toolbar_bg'])
-        style.configure('TLabel', background=DEFAULT_THEME['bg'])
+        style.configure('.', background=THEME_BG, foreground=THEME_FG)
+        style.configure('TFrame', background=THEME_BG)
+        style.configure('TButton', background=THEME_TOOLBAR_BG)
+        style.configure('TLabel', background=THEME_BG)
         style.configure('TEntry', fieldbackground='#333333')
         style.configure('Treeview', background='#333333', fieldbackground='#333333', foreground='white')
         
         # Custom styles
         style.configure('Toolbutton.TButton', padding=5)
-        style.configure('Status.TLabel', background=DEFAULT_THEME['toolbar_bg'], relief=tk.SUNKEN)
+        style.configure('Status.TLabel', background=THEME_TOOLBAR_BG, relief=tk.SUNKEN)
     
     def create_ui(self):
         # Main layout
@@ -450,6 +622,9 @@ class GUIBuilder:
         self.create_properties_panel()
     
     def create_widget_buttons(self):
+        # (button, lowercased label) pairs so filtering needs no Tk queries
+        self._widget_button_cache = []
+        self._last_search = ''
         for widget_type in SUPPORTED_WIDGETS:
             btn = ttk.Button(
                 self.widget_buttons_frame,
@@ -458,16 +633,20 @@ class GUIBuilder:
                 style='Toolbutton.TButton'
             )
             btn.pack(fill=tk.X, pady=2)
+            self._widget_button_cache.append((btn, widget_type.lower()))
     
     def filter_widgets(self, event=None):
         search_term = self.search_var.get().lower()
+        # Modifier and navigation keys fire <KeyRelease> without changing the text
+        if search_term == self._last_search:
+            return
+        self._last_search = search_term
         
-        for child in self.widget_buttons_frame.winfo_children():
-            widget_text = child['text'].lower()
+        for btn, widget_text in self._widget_button_cache:
             if search_term in widget_text:
-                child.pack(fill=tk.X, pady=2)
+                btn.pack(fill=tk.X, pady=2)
             else:
-                child.pack_forget()
+                btn.pack_forget()
     
     def create_properties_panel(self):
         properties_frame = ttk.LabelFrame(self.toolbox, text="Properties", padding=5)
@@ -481,7 +660,7 @@ class GUIBuilder:
         # Canvas with scrollbars
         self.canvas = tk.Canvas(
             canvas_container,
-            bg=DEFAULT_THEME['canvas_bg'],
+            bg=THEME_CANVAS_BG,
             highlightthickness=0
         )
         
@@ -502,6 +681,23 @@ class GUIBuilder:
         self.canvas.bind("<B1-Motion>", self.canvas_drag)
         self.canvas.bind("<Configure>", self.on_canvas_resize)
         
+        # Canvas size as last reported by <Configure>, so grid redraws
+        # don't have to query Tk for it
+        self.canvas_width = 0
+        self.canvas_height = 0
+        self._resize_after_id = None
+        self._last_pan = None  # Pointer position of the last pan step
+        
+        # A single grid cell (dotted top and left edges). draw_grid tiles it
+        # into one canvas-sized image instead of drawing individual lines.
+        self.grid_tile = tk.PhotoImage(width=GRID_SIZE, height=GRID_SIZE)
+        for i in range(0, GRID_SIZE, 3):
+            self.grid_tile.put(THEME_OUTLINE, to=(i, 0, i + 1, 1))
+            self.grid_tile.put(THEME_OUTLINE, to=(0, i, 1, i + 1))
+        self.grid_image = None
+        self.grid_image_size = (0, 0)
+        self.grid_item = None
+        
         # Initialize zoom
         self.zoom_level = 1.0
     
@@ -512,6 +708,7 @@ class GUIBuilder:
     def hide_grid(self):
         self.grid_visible = False
         self.canvas.delete("grid_line")
+        self.grid_item = None
     
     def toggle_grid(self):
         if self.grid_visible:
@@ -523,28 +720,46 @@ class GUIBuilder:
         if not self.grid_visible:
             return
             
-        self.canvas.delete("grid_line")
-        
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
-        
-        for x in range(0, width, GRID_SIZE):
-            self.canvas.create_line(
-                x, 0, x, height,
-                tags=("grid_line",),
-                fill="#3e3e42",
-                dash=(1, 2)
-            )
+        # Nothing to draw until the canvas has been laid out
+        if not self.canvas_width or not self.canvas_height:
+            return
         
-        for y in range(0, height, GRID_SIZE):
-            self.canvas.create_line(
-                0, y, width, y,
-                tags=("grid_line",),
-                fill="#3e3e42",
-                dash=(1, 2)
+        # Only re-render the grid image when the canvas outgrows it
+        cached_width, cached_height = self.grid_image_size
+        if self.canvas_width > cached_width or self.canvas_height > cached_height:
+            width = max(self.canvas_width, cached_width)
+            height = max(self.canvas_height, cached_height)
+            image = tk.PhotoImage(width=width, height=height)
+            # Photo image copy tiles the source across the whole target region
+            image.tk.call(image.name, 'copy', self.grid_tile.name, '-to', 0, 0, width, height)
+            if self.grid_item:
+                self.canvas.itemconfig(self.grid_item, image=image)
+            self.grid_image = image
+            self.grid_image_size = (width, height)
+        
+        if not self.grid_item:
+            self.grid_item = self.canvas.create_image(
+                0, 0,
+                image=self.grid_image,
+                anchor='nw',
+                tags=("grid_line",)
             )
     
     def on_canvas_resize(self, event):
+        # <Configure> also fires for moves and other non-resize changes
+        if (event.width, event.height) == (self.canvas_width, self.canvas_height):
+            return
+        
+        self.canvas_width = event.width
+        self.canvas_height = event.height
+        
+        # Coalesce the burst of events from a window drag into one redraw
+        if self._resize_after_id:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(50, self._do_resize_redraw)
+    
+    def _do_resize_redraw(self):
+        self._resize_after_id = None
         if self.grid_visible:
             self.draw_grid()
     
@@ -568,6 +783,46 @@ class GUIBuilder:
         self.root.bind("<Control-y>", lambda e: self.redo())
         self.root.bind("<Delete>", lambda e: self.delete_selected())
     
+    def setup_widget_bindings(self):
+        handlers = {
+            "<ButtonPress-1>": DraggableWidget.on_start,
+            "<B1-Motion>": DraggableWidget.on_drag,
+            "<ButtonRelease-1>": DraggableWidget.on_release,
+            "<Enter>": DraggableWidget.on_hover,
+            "<Leave>": DraggableWidget.on_leave,
+            "<Button-3>": DraggableWidget.show_context_menu,
+        }
+        for sequence, handler in handlers.items():
+            self.root.bind_class(
+                WIDGET_BINDTAG, sequence,
+                lambda e, h=handler: self.dispatch_widget_event(e, h)
+            )
+    
+    def dispatch_widget_event(self, event, handler):
+        dw = self.widgets_by_path.get(str(event.widget))
+        if dw:
+            handler(dw, event)
+    
+    def get_context_menu(self, container):
+        menu = self.context_menus.get(container)
+        if menu:
+            return menu
+        
+        # Commands act on whichever widget last opened the menu
+        menu = tk.Menu(self.root, tearoff=0)
+        menu.add_command(label="Properties", command=lambda: self.context_menu_target.edit_properties())
+        menu.add_command(label="Delete", command=lambda: self.context_menu_target.delete())
+        menu.add_separator()
+        menu.add_command(label="Bring to Front", command=lambda: self.context_menu_target.bring_to_front())
+        menu.add_command(label="Send to Back", command=lambda: self.context_menu_target.send_to_back())
+        
+        if container:
+            menu.add_separator()
+            menu.add_command(label="Add Widget Inside", command=lambda: self.context_menu_target.add_widget_inside())
+        
+        self.context_menus[container] = menu
+        return menu
+    
     def select_widget(self, widget_type):
         self.active_widget = widget_type
         self.status_label.config(text=f"Selected: {widget_type} - Click on canvas to place")
@@ -576,76 +831,73 @@ class GUIBuilder:
         if self.active_widget:
             self.place_widget(event.x, event.y)
         else:
+            # Anchor a possible pan at the press position
+            self.canvas.scan_mark(event.x, event.y)
+            self._last_pan = (event.x, event.y)
+            
             # Check if a widget was clicked to select it
             clicked = self.canvas.find_withtag("current")
-            if clicked and "widget" in self.canvas.gettags(clicked[0]):
-                for dw in self.widgets:
-                    if dw.id == clicked[0]:
-                        dw.select()
-                        break
+            if clicked:
+                dw = self.widgets.get(clicked[0])
+                if dw:
+                    dw.select()
     
     def place_widget(self, x, y):
         if not self.active_widget:
-            return
+            return None
             
         # Snap to grid
         x = round(x / GRID_SIZE) * GRID_SIZE
         y = round(y / GRID_SIZE) * GRID_SIZE
         
-        widget = None
-        widget_type = self.active_widget
+        dw = self._construct_widget(self.active_widget, x, y)
+        if dw:
+            # Reset selection
+            self.active_widget = None
+            self.status_label.config(text="Ready")
+        return dw
+    
+    def _construct_widget(self, widget_type, x, y, properties=None, record_undo=True):
+        if widget_type not in WIDGET_FACTORIES:
+            return None
         
         try:
-            if widget_type == "Button":
-                widget = ttk.Button(self.canvas, text="Button")
-            elif widget_type == "Label":
-                widget = ttk.Label(self.canvas, text="Label")
-            elif widget_type == "Entry":
-                widget = ttk.Entry(self.canvas)
-            elif widget_type == "Text":
-                widget = tk.Text(self.canvas, width=30, height=5)
-            elif widget_type == "Checkbutton":
-                widget = ttk.Checkbutton(self.canvas, text="Checkbutton")
-            elif widget_type == "Radiobutton":
-                widget = ttk.Radiobutton(self.canvas, text="Radiobutton")
-            elif widget_type == "Scale":
-                widget = ttk.Scale(self.canvas, from_=0, to=100)
-            elif widget_type == "Listbox":
-                widget = tk.Listbox(self.canvas, height=4)
-                for item in ["Item 1", "Item 2", "Item 3"]:
-                    widget.insert(tk.END, item)
-            elif widget_type == "Scrollbar":
-                widget = ttk.Scrollbar(self.canvas)
-            elif widget_type == "Frame":
-                widget = ttk.Frame(self.canvas, width=200, height=200, relief=tk.RIDGE)
-            elif widget_type == "LabelFrame":
-                widget = ttk.LabelFrame(self.canvas, text="LabelFrame", width=200, height=200)
-            elif widget_type == "Combobox":
-                widget = ttk.Combobox(self.canvas, values=["Option 1", "Option 2", "Option 3"])
-            elif widget_type == "Progressbar":
-                widget = ttk.Progressbar(self.canvas, length=200, mode='determinate')
-                widget.step(50)
+            widget = create_widget(widget_type, self.canvas)
+            for prop, value in (properties or {}).items():
+                try:
+                    widget.config({prop: value})
+                except Exception:
+                    pass  # Skip properties that don't apply
+            
+            # Pass self (the builder) into DraggableWidget for undo support
+            dw = DraggableWidget(self, self.canvas, widget, widget_type, x, y)
+            self.register_widget(dw)
+            
+            # Push creation action to undo stack
+            if record_undo:
+                self.push_undo((UndoOp.CREATE, self.snapshot_widget(dw)))
+            return dw
             
-            if widget:
-                # Pass self (the builder) into DraggableWidget for undo support
-                dw = DraggableWidget(self, self.canvas, widget, widget_type, x, y)
-                self.widgets.append(dw)
-                
-                # Push creation action to undo stack
-                self.push_undo(('create', dw))
-                
-                # Reset selection
-                self.active_widget = None
-                self.status_label.config(text="Ready")
-                
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create widget: {str(e)}")
             logging.error(f"Widget creation error: {str(e)}")
+            return None
+    
+    def register_widget(self, dw):
+        self.widgets[dw.id] = dw
+        self.widgets_by_path[str(dw.widget)] = dw
+    
+    def unregister_widget(self, dw):
+        self.widgets.pop(dw.id, None)
+        self.widgets_by_path.pop(str(dw.widget), None)
+        self.selected.discard(dw)
     
     def canvas_drag(self, event):
-        # Handle canvas panning when no widget is being placed
-        if not self.active_widget:
+        # Handle canvas panning when no widget is being placed; skip motion
+        # events that didn't actually move the pointer
+        if not self.active_widget and (event.x, event.y) != self._last_pan:
             self.canvas.scan_dragto(event.x, event.y, gain=1)
+            self._last_pan = (event.x, event.y)
     
     def zoom(self, factor):
         self.zoom_level *= factor
@@ -661,12 +913,15 @@ class GUIBuilder:
         self.status_label.config(text="New project created")
     
     def clear_canvas(self):
-        for dw in self.widgets:
+        for dw in self.widgets.values():
             self.canvas.delete(dw.id)
             dw.widget.destroy()
-        self.widgets = []
-        self.undo_stack = []
-        self.redo_stack = []
+        self.widgets = {}
+        self.widgets_by_path = {}
+        self.selected.clear()
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.id_aliases = {}
     
     def open_project(self):
         file_path = filedialog.askopenfilename(
@@ -676,8 +931,8 @@ class GUIBuilder:
         
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    data = _loads(f.read())
                 
                 self.clear_canvas()
                 self.current_file = file_path
@@ -692,22 +947,14 @@ class GUIBuilder:
                 logging.error(f"File open error: {str(e)}")
     
     def load_widget(self, widget_data):
-        widget_type = widget_data['type']
-        x = widget_data['x']
-        y = widget_data['y']
-        properties = widget_data.get('properties', {})
-        
-        self.active_widget = widget_type
-        self.place_widget(x, y)
-        
-        # Apply properties to the last created widget
-        if self.widgets:
-            dw = self.widgets[-1]
-            for prop, value in properties.items():
-                try:
-                    dw.widget.config({prop: value})
-                except Exception:
-                    pass  # Skip properties that don't apply
+        # Loaded widgets keep their saved position and aren't undoable
+        return self._construct_widget(
+            widget_data['type'],
+            widget_data['x'],
+            widget_data['y'],
+            widget_data.get('properties', {}),
+            record_undo=False
+        )
     
     def save_project(self):
         if self.current_file:
@@ -733,23 +980,18 @@ class GUIBuilder:
                 'widgets': []
             }
             
-            for dw in self.widgets:
+            for dw in self.widgets.values():
                 widget_data = {
                     'type': dw.widget_type,
                     'x': dw.x,
                     'y': dw.y,
-                    'properties': {
-                        'text': dw.widget.cget('text') if 'text' in dw.widget.keys() else '',
-                        'width': dw.widget.cget('width') if 'width' in dw.widget.keys() else '',
-                        'height': dw.widget.cget('height') if 'height' in dw.widget.keys() else '',
-                        'background': dw.widget.cget('bg') if 'bg' in dw.widget.keys() else '',
-                        'foreground': dw.widget.cget('fg') if 'fg' in dw.widget.keys() else ''
-                    }
+                    'properties': self.widget_properties(dw)
                 }
                 data['widgets'].append(widget_data)
             
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            payload = _dumps(data)
+            with open(file_path, 'wb') as f:
+                f.write(payload)
             
             self.status_label.config(text=f"Saved: {file_path}")
             
@@ -757,6 +999,17 @@ class GUIBuilder:
             messagebox.showerror("Error", f"Failed to save file: {str(e)}")
             logging.error(f"File save error: {str(e)}")
     
+    def widget_properties(self, dw):
+        # One Tcl round-trip for all options instead of a cget per key
+        opts = dw.widget.configure()
+        return {
+            'text': config_value(opts, 'text'),
+            'width': config_value(opts, 'width'),
+            'height': config_value(opts, 'height'),
+            'background': config_value(opts, 'background'),
+            'foreground': config_value(opts, 'foreground')
+        }
+    
     def export_python(self):
         file_path = filedialog.asksaveasfilename(
             defaultextension=".py",
@@ -777,54 +1030,43 @@ class GUIBuilder:
                 logging.error(f"Export error: {str(e)}")
     
     def generate_python_code(self):
-        code = [
-            "import tkinter as tk",
-            "from tkinter import ttk",
-            "",
-            "def create_gui():",
-            "    root = tk.Tk()",
-            "    root.title('Generated GUI')",
-            ""
-        ]
-        
-        # Create widgets
-        for i, dw in enumerate(self.widgets):
-            var_name = f"widget_{i}"
-            
-            if dw.widget_type == "Button":
-                text = dw.widget.cget('text') if 'text' in dw.widget.keys() else 'Button'
-                code.append(f"    {var_name} = ttk.Button(root, text='{text}')")
-            elif dw.widget_type == "Label":
-                text = dw.widget.cget('text') if 'text' in dw.widget.keys() else 'Label'
-                code.append(f"    {var_name} = ttk.Label(root, text='{text}')")
-            elif dw.widget_type == "Entry":
-                code.append(f"    {var_name} = ttk.Entry(root)")
-            # Add other widget types as needed...
-            
-            code.append(f"    {var_name}.place(x={dw.x}, y={dw.y})")
-            code.append("")
-        
-        code.append("    root.mainloop()")
-        code.append("")
-        code.append("if __name__ == '__main__':")
-        code.append("    create_gui()")
-        
-        return "\n".join(code)
+        # One pre-joined block per widget, formatted into the static template once
+        body = "".join([_export_widget(i, dw) for i, dw in enumerate(self.widgets.values())])
+        return _GUI_TEMPLATE.format(body=body)
     
     def delete_selected(self):
-        selected = [dw for dw in self.widgets if dw.selected]
+        selected = list(self.selected)
         if not selected:
             return
             
+        # Record the whole deletion as one undo step
+        ops = []
         for dw in selected:
-            self.push_undo(('delete', dw))
+            ops.append((UndoOp.DELETE, self.snapshot_widget(dw)))
             self.canvas.delete(dw.id)
             dw.widget.destroy()
-            self.widgets.remove(dw)
+            self.unregister_widget(dw)
+        self.push_undo((UndoOp.GROUP, ops) if len(ops) > 1 else ops[0])
     
     def push_undo(self, action):
+        # Fold a quick follow-up move of the same widget into the previous
+        # entry, keeping its timestamp, so one undo reverts the whole gesture
+        if action[0] == UndoOp.MOVE and self.undo_stack:
+            top = self.undo_stack[-1]
+            if (top[0] == UndoOp.MOVE and top[1] == action[1]
+                    and action[4] - top[4] < MOVE_MERGE_WINDOW):
+                dx = top[2] + action[2]
+                dy = top[3] + action[3]
+                if dx or dy:
+                    self.undo_stack[-1] = (UndoOp.MOVE, top[1], dx, dy, top[4])
+                else:
+                    # The widget ended up where it started; nothing to undo
+                    self.undo_stack.pop()
+                self.redo_stack.clear()
+                return
+        
         self.undo_stack.append(action)
-        self.redo_stack = []  # Clear redo stack when a new action is performed
+        self.redo_stack.clear()  # Clear redo stack when a new action is performed
     
     def undo(self):
         if not self.undo_stack:
@@ -832,22 +1074,7 @@ class GUIBuilder:
             
         action = self.undo_stack.pop()
         self.redo_stack.append(action)
-        
-        if action[0] == 'create':
-            _, dw = action
-            self.canvas.delete(dw.id)
-            dw.widget.destroy()
-            self.widgets.remove(dw)
-        elif action[0] == 'delete':
-            _, dw = action
-            self.widgets.append(dw)
-            dw.id = self.canvas.create_window(dw.x, dw.y, window=dw.widget)
-        elif action[0] == 'move':
-            _, dw, old_x, old_y = action
-            dx = old_x - dw.x
-            dy = old_y - dw.y
-            self.canvas.move(dw.id, dx, dy)
-            dw.x, dw.y = old_x, old_y
+        self.revert_action(action)
     
     def redo(self):
         if not self.redo_stack:
@@ -855,29 +1082,64 @@ class GUIBuilder:
             
         action = self.redo_stack.pop()
         self.undo_stack.append(action)
-        
-        if action[0] == 'create':
-            _, dw = action
-            self.widgets.append(dw)
-            dw.id = self.canvas.create_window(dw.x, dw.y, window=dw.widget)
-        elif action[0] == 'delete':
-            _, dw = action
-            self.canvas.delete(dw.id)
-            dw.widget.destroy()
-            self.widgets.remove(dw)
-        elif action[0] == 'move':
-            _, dw, old_x, old_y = action
-            dx = dw.x - old_x
-            dy = dw.y - old_y
-            self.canvas.move(dw.id, dx, dy)
-            dw.x, dw.y = old_x, old_y
+        self.apply_action(action)
+    
+    def revert_action(self, action):
+        self._revert_handlers[action[0]](*action[1:])
+    
+    def apply_action(self, action):
+        self._apply_handlers[action[0]](*action[1:])
+    
+    def _revert_group(self, actions):
+        for sub_action in reversed(actions):
+            self.revert_action(sub_action)
+    
+    def _apply_group(self, actions):
+        for sub_action in actions:
+            self.apply_action(sub_action)
+    
+    def shift_widget(self, widget_id, dx, dy):
+        dw = self.resolve_widget(widget_id)
+        if not dw:
+            return
+        # Place the item at its absolute target rather than moving it relatively
+        dw.x += dx
+        dw.y += dy
+        self.canvas.coords(dw.id, dw.x, dw.y)
+    
+    def resolve_widget(self, widget_id):
+        # Undo entries keep the item id the widget had when they were
+        # recorded; follow it to the widget's current incarnation
+        while widget_id in self.id_aliases:
+            widget_id = self.id_aliases[widget_id]
+        return self.widgets.get(widget_id)
+    
+    def snapshot_widget(self, dw):
+        return WidgetData(dw.widget_type, dw.x, dw.y, self.widget_properties(dw), dw.id)
+    
+    def discard_snapshot(self, snapshot):
+        dw = self.resolve_widget(snapshot.id)
+        if not dw:
+            return
+        # Refresh the snapshot so redo rebuilds the widget as it is now
+        snapshot.x, snapshot.y = dw.x, dw.y
+        snapshot.properties = self.widget_properties(dw)
+        snapshot.id = dw.id
+        self.canvas.delete(dw.id)
+        dw.widget.destroy()
+        self.unregister_widget(dw)
+    
+    def restore_snapshot(self, snapshot):
+        dw = self.load_widget(asdict(snapshot))
+        if dw:
+            self.id_aliases[snapshot.id] = dw.id
     
     def cut(self):
         self.copy()
         self.delete_selected()
     
     def copy(self):
-        selected = [dw for dw in self.widgets if dw.selected]
+        selected = list(self.selected)
         if not selected:
             return
             
@@ -889,22 +1151,36 @@ class GUIBuilder:
         messagebox.showinfo("Info", "Paste functionality will be implemented")
     
     def show_docs(self):
+        import webbrowser  # Only needed here; keep it out of startup
         webbrowser.open("LinkToGitHub")
     
+    def _load_about_photo(self):
+        # The LANCZOS resize is expensive, so do it once and keep the
+        # PhotoImage on self (which also keeps Tk from freeing it)
+        if self._about_photo or not HAS_LOGO:
+            return self._about_photo
+        
+        # PIL is only needed here, so import it on demand; without it the
+        # dialog simply has no logo
+        try:
+            from PIL import Image, ImageTk
+        except ImportError:
+            return None
+        
+        img = Image.open(LOGO_PATH)
+        img = img.resize((100, 100), Image.Resampling.LANCZOS)
+        self._about_photo = ImageTk.PhotoImage(img)
+        return self._about_photo
+    
     def show_about(self):
         about_window = tk.Toplevel(self.root)
         about_window.title("About")
         about_window.geometry("400x300")
         about_window.resizable(False, False)
         
-        logo_path = os.path.join(os.path.dirname(__file__), "logo.png")
-        if os.path.exists(logo_path):
-            img = Image.open(logo_path)
-            img = img.resize((100, 100), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
-            
+        photo = self._load_about_photo()
+        if photo:
             logo_label = tk.Label(about_window, image=photo)
-            logo_label.image = photo
             logo_label.pack(pady=10)
         
         tk.Label(about_window, text=f"{APP_NAME} v{VERSION}").pack()